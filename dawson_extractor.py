@@ -7,14 +7,192 @@ This script efficiently extracts court order PDFs from the DAWSON
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as StreamError
 import json
+import hashlib
+import itertools
+import logging
+import sys
+import math
 import time
 import random
 import os
+import queue
+import shutil
+import sqlite3
+import threading
+from collections import Counter
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from urllib.parse import urlparse, parse_qs, parse_qsl, urlencode
+from typing import Any, BinaryIO, Callable, List, Dict, Optional, Set
 from datetime import datetime
 
+try:
+    import ahocorasick  # Optional: single-pass multi-substring matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: streaming parse of large search responses
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger('dawson')
+
+# Makes docket numbers safe to use in filenames
+_DOCKET_TABLE = str.maketrans('/', '_')
+
+
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route log records through a queue so worker threads never block on stdout.
+
+    Args:
+        level: Minimum level to display
+
+    Returns:
+        Started listener; call stop() on exit to flush remaining records
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+class BloomFilter:
+    """
+    Compact, thread-safe set of strings with a small false-positive rate.
+
+    Used instead of a set for very large libraries. Hashing is unseeded, so a
+    false positive is the same ID on every run; callers confirm positives
+    against the directory index (see _already_downloaded) rather than
+    skipping that document forever.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        """
+        Size the filter for the expected number of items.
+
+        Args:
+            capacity: Number of items the filter should hold at error_rate
+            error_rate: Target false-positive probability
+        """
+        capacity = max(1, capacity)
+        self._num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, item: str):
+        """Derive bit positions via double hashing of a single digest."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+
+    def add(self, item: str):
+        """Add an item to the filter."""
+        positions = self._positions(item)
+        with self._lock:
+            for pos in positions:
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+            self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class TokenBucket:
+    """Thread-safe token bucket: bursts up to capacity, then refills at rate tokens/sec."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._strikes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self.rate <= 0:
+                    return
+                else:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Empty the bucket and hold all callers for the given number of seconds."""
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            if resume_at > self._paused_until:
+                self._paused_until = resume_at
+                self._updated = resume_at
+                self._tokens = 0.0
+
+    def backoff(self, base: float = 1.0, limit: float = 60.0):
+        """Pause for an interval that doubles with each consecutive throttling signal."""
+        with self._lock:
+            self._strikes += 1
+            seconds = min(limit, base * 2 ** (self._strikes - 1))
+        self.pause(seconds)
+
+    def recover(self):
+        """Reset the backoff interval after a successful request."""
+        with self._lock:
+            self._strikes = 0
+
 
 class DAWSONExtractor:
     """Efficiently extracts court orders from DAWSON public API."""
@@ -24,6 +202,24 @@ class DAWSONExtractor:
         'green': "https://public-api-green.dawson.ustaxcourt.gov"
     }
 
+    # SQLite cache of API results and directory listings reused across runs
+    CACHE_FILENAME = '.dawson_cache.sqlite'
+
+    # Cache writes (index entries, signed URLs, API results) are committed in batches of this size
+    CACHE_COMMIT_BATCH = 100
+
+    # Assumed lifetime of a signed download URL that doesn't state its expiry
+    DEFAULT_URL_TTL = 600
+
+    # Counters reported by _print_summary
+    STAT_NAMES = ('orders_downloaded', 'orders_skipped', 'api_calls', 'errors')
+
+    # Run-folder metadata file used when metadata_format is "jsonl"
+    METADATA_JSONL_FILENAME = 'metadata.jsonl'
+
+    # Maximum metadata sidecars written per writer-thread wake-up
+    WRITER_BATCH_SIZE = 32
+
     def __init__(self, config: Dict):
         """
         Initialize the extractor with configuration.
@@ -34,12 +230,41 @@ class DAWSONExtractor:
         self.config = config
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'DAWSON-Extractor/1.0 (Educational/Research)'
+            'User-Agent': 'DAWSON-Extractor/1.0 (Educational/Research)',
+            'Connection': 'keep-alive'
         })
 
-        # Set API environment (blue or green)
-        api_env = config.get('api_environment', 'green')
-        self.base_url = self.API_ENVIRONMENTS.get(api_env, self.API_ENVIRONMENTS['green'])
+        # One session is shared by all worker threads; size its pool so every
+        # worker can keep a connection alive instead of reconnecting, and let
+        # urllib3 retry transient failures with exponential backoff. With
+        # pool_block a thread waits for a pooled connection rather than opening
+        # a throwaway one that is discarded afterwards. With raise_on_status
+        # off, the last 429/5xx is returned rather than raised, so
+        # _observe_rate_limit_headers sees it and can pause every worker.
+        pool_size = max(32, config.get('max_connections_per_host', 16))
+        retry = Retry(
+            total=config.get('max_retries', 5),
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size,
+                              max_retries=retry, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Set API environment (blue or green); a list spreads API calls
+        # round-robin across several environments
+        api_envs = config.get('api_environment', 'green')
+        if isinstance(api_envs, str):
+            api_envs = [api_envs]
+        self.base_urls = list(dict.fromkeys(
+            self.API_ENVIRONMENTS.get(env, self.API_ENVIRONMENTS['green']) for env in api_envs
+        )) or [self.API_ENVIRONMENTS['green']]
+        self.base_url = self.base_urls[0]
+        self._base_url_cycle = itertools.cycle(self.base_urls)
 
         # Create output directory with run-specific subfolder
         base_output_dir = Path(config.get('output_dir', 'downloads'))
@@ -59,58 +284,528 @@ class DAWSONExtractor:
         self.base_output_dir = base_output_dir
         self.output_dir = base_output_dir / run_folder_name
         self.output_dir.mkdir(exist_ok=True)
-
-        # Statistics
-        self.stats = {
-            'orders_downloaded': 0,
-            'orders_skipped': 0,
-            'api_calls': 0,
-            'errors': 0,
-            'start_time': datetime.now()
-        }
+        self._output_dir_str = str(self.output_dir)
+
+        # Lowercased document types, precomputed for _matches_document_type
+        self._match_mode = config.get('match_mode', 'substring')
+        self._allowed_lower_list = [t.lower() for t in doc_types]
+        self._allowed_lower_set = frozenset(self._allowed_lower_list)
+        self._automaton = self._build_automaton(self._allowed_lower_list)
+        self._type_match_cache: Dict[str, bool] = {}
+
+        # Guards shared state touched by worker threads
+        self._lock = threading.Lock()
+
+        # Rate limiting shared by all worker threads
+        self._limiter = TokenBucket(self._requests_per_second(), config.get('rate_limit_burst', 5))
+
+        # Hosts other than the API (e.g. the S3 bucket behind signed download
+        # URLs) have their own quota, so they get their own buckets
+        self._api_hosts = frozenset(urlparse(url).hostname or '' for url in self.base_urls)
+        self._host_limiters: Dict[str, TokenBucket] = {}
+
+        # Caps simultaneous requests to any one host, whatever the worker counts
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+        # Metadata sidecars are written by a single background thread so
+        # download workers don't block on JSON encoding and file creation
+        self._writer_queue: queue.Queue = queue.Queue()
+        # With "jsonl", one line per download is appended to a single file
+        # instead of a sidecar per PDF; the writer thread opens it on first use
+        self._metadata_jsonl_path = None
+        if config.get('metadata_format', 'json') == 'jsonl':
+            self._metadata_jsonl_path = self.output_dir / self.METADATA_JSONL_FILENAME
+        self._metadata_jsonl = None
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+        # Signed download URLs, directory listings and case details survive restarts
+        self._cache_lock = threading.Lock()
+        self._cache = sqlite3.connect(str(base_output_dir / self.CACHE_FILENAME),
+                                      check_same_thread=False)
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS urls(doc_id TEXT PRIMARY KEY, url TEXT, expires INTEGER)"
+        )
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS dirs(path TEXT PRIMARY KEY, mtime_ns INTEGER, subdirs TEXT)"
+        )
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS docs(dir TEXT, doc_id TEXT, PRIMARY KEY(dir, doc_id))"
+        )
+        self._cache.execute("CREATE INDEX IF NOT EXISTS docs_doc_id ON docs(doc_id)")
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS cases(docket TEXT PRIMARY KEY, fetched_at INTEGER, body BLOB)"
+        )
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS url_hashes(hash BLOB PRIMARY KEY, doc_id TEXT, path TEXT)"
+        )
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS searches(keyword TEXT PRIMARY KEY, fetched_at INTEGER, body BLOB)"
+        )
+        # Signed URLs are kept until they expire, so clear out the stale ones
+        self._cache.execute("DELETE FROM urls WHERE expires <= ?", (int(time.time()),))
+        self._cache.commit()
+        self._case_ttl = config.get('case_details_ttl_hours', 24) * 3600
+        # Case details older than the TTL can never be read again
+        self._cache.execute("DELETE FROM cases WHERE fetched_at <= ?",
+                            (int(time.time() - max(0, self._case_ttl)),))
+        self._cache.commit()
+        self._search_ttl = config.get('search_cache_ttl_hours', 24) * 3600
+        self._run_dir_key = os.path.relpath(self.output_dir, base_output_dir)
+        self._pending_cache_writes = 0
+        self._closed = False
+
+        # Statistics, kept as lock-free counters and only read for the summary
+        self._stat_counters = {name: itertools.count() for name in self.STAT_NAMES}
+        self._stat_reads = dict.fromkeys(self.STAT_NAMES, 0)
+        self.start_time = datetime.now()
 
         # Track existing documents to avoid duplicates
         self.existing_docs = self._scan_existing_documents()
 
-    def _scan_existing_documents(self) -> set:
-        """Scan all subfolders in base output directory for already downloaded documents."""
-        existing = set()
-        # Scan all subfolders and root for existing PDFs
-        for pdf_file in self.base_output_dir.glob("**/*.pdf"):
-            # Extract document_id from filename: {docket}_{document_id}_{date}.pdf
-            parts = pdf_file.stem.split('_')
-            if len(parts) >= 2:
-                # Document ID is the second part (UUID format)
-                doc_id = parts[1]
-                existing.add(doc_id)
+        # Hashes of canonical download URLs already fetched, mapped to the file
+        # they were saved as, so two entries resolving to the same stored file
+        # are only downloaded once. Files the scan no longer finds are dropped.
+        with self._cache_lock:
+            self._cache.execute(
+                "DELETE FROM url_hashes WHERE doc_id NOT IN (SELECT doc_id FROM docs)"
+            )
+            self._cache.commit()
+            self._url_memo: Dict[bytes, str] = {
+                url_hash: os.path.join(self.base_output_dir, path)
+                for url_hash, path in self._cache.execute("SELECT hash, path FROM url_hashes")
+            }
+
+    def _scan_existing_documents(self):
+        """
+        Scan all subfolders in base output directory for already downloaded documents.
+
+        Directory listings are cached in the SQLite cache keyed by each
+        directory's mtime, so only folders that changed since the last run are
+        rescanned. Top-level run folders are walked in parallel.
+
+        Returns:
+            Set of document IDs, or a BloomFilter once bloom_filter_threshold is reached
+        """
+        index = self._load_directory_index()
+
+        root = str(self.base_output_dir)
+        scanned = {}
+        root_entry = self._scan_directory(root, index)
+        if root_entry:
+            scanned['.'] = root_entry
+            subtrees = [os.path.join(root, name) for name in root_entry['subdirs']]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for entries in executor.map(lambda path: self._scan_tree(path, index), subtrees):
+                    scanned.update(entries)
+
+        self._save_directory_index(index, scanned)
+
+        # Very large libraries trade exact membership for a much smaller
+        # filter, filled straight from the scanned listings so a full set of
+        # IDs is never built alongside it
+        total = sum(len(entry['ids']) for entry in scanned.values())
+        threshold = self.config.get('bloom_filter_threshold', 100_000)
+        if threshold and total >= threshold:
+            existing = BloomFilter(capacity=max(2 * total, threshold))
+            for entry in scanned.values():
+                for doc_id in entry['ids']:
+                    existing.add(doc_id)
+        else:
+            # Interned IDs share one object (and cached hash) with later lookups
+            existing = set()
+            for entry in scanned.values():
+                existing.update(map(sys.intern, entry['ids']))
+
         if existing:
-            print(f"Found {len(existing)} existing documents in {self.base_output_dir}")
+            logger.info(f"Found {len(existing)} existing documents in {self.base_output_dir}")
         return existing
 
-    def _rate_limit(self):
-        """Implement rate limiting between API calls."""
-        delay = self.config.get('rate_limit_delay', 1.5)
-        time.sleep(delay)
+    def _already_downloaded(self, document_id: str) -> bool:
+        """
+        Check whether a document is already in the library.
+
+        Bloom filter positives are confirmed against the directory index, so a
+        false positive doesn't hide a document on every run.
+
+        Args:
+            document_id: Document entry ID
+
+        Returns:
+            True if the document was downloaded before
+        """
+        if document_id not in self.existing_docs:
+            return False
+        if not isinstance(self.existing_docs, BloomFilter):
+            return True
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT 1 FROM docs WHERE doc_id = ? LIMIT 1", (document_id,)
+            ).fetchone()
+        return row is not None
+
+    def _load_directory_index(self) -> Dict[str, Dict]:
+        """Load cached directory entries (mtime_ns, ids, subdirs) keyed by relative path."""
+        with self._cache_lock:
+            dirs = self._cache.execute("SELECT path, mtime_ns, subdirs FROM dirs").fetchall()
+            docs = self._cache.execute("SELECT dir, doc_id FROM docs").fetchall()
+
+        index = {
+            path: {'mtime_ns': mtime_ns, 'ids': [], 'subdirs': _json_loads(subdirs)}
+            for path, mtime_ns, subdirs in dirs
+        }
+        for path, doc_id in docs:
+            entry = index.get(path)
+            if entry is not None:
+                entry['ids'].append(doc_id)
+        return index
+
+    def _save_directory_index(self, index: Dict[str, Dict], scanned: Dict[str, Dict]):
+        """Persist entries that were rescanned and drop directories that disappeared."""
+        changed = [(path, entry) for path, entry in scanned.items() if entry is not index.get(path)]
+        removed = [(path,) for path in index if path not in scanned]
+        with self._cache_lock:
+            self._cache.executemany("DELETE FROM dirs WHERE path = ?", removed)
+            self._cache.executemany("DELETE FROM docs WHERE dir = ?", removed)
+            for path, entry in changed:
+                self._cache.execute("DELETE FROM docs WHERE dir = ?", (path,))
+                self._cache.executemany(
+                    "INSERT OR IGNORE INTO docs(dir, doc_id) VALUES (?, ?)",
+                    ((path, doc_id) for doc_id in entry['ids'])
+                )
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO dirs(path, mtime_ns, subdirs) VALUES (?, ?, ?)",
+                    (path, entry['mtime_ns'], _json_dumps(entry['subdirs']).decode('utf-8'))
+                )
+            self._cache.commit()
+
+    def _cache_write(self, sql: str, params: tuple):
+        """
+        Run a cache write, committing in batches to limit fsyncs.
+
+        Uncommitted rows are already visible to reads on this connection, so
+        lookups see them straight away; close() commits the remainder.
+
+        Args:
+            sql: INSERT/DELETE statement
+            params: Statement parameters
+        """
+        with self._cache_lock:
+            self._cache.execute(sql, params)
+            self._pending_cache_writes += 1
+            if self._pending_cache_writes >= self.CACHE_COMMIT_BATCH:
+                self._commit_cache_locked()
+
+    def _commit_cache_locked(self):
+        """Commit pending cache writes (caller holds _cache_lock)."""
+        if self._pending_cache_writes:
+            self._cache.commit()
+            self._pending_cache_writes = 0
+
+    def _index_downloaded_document(self, document_id: str):
+        """Record a new download in the index."""
+        self._cache_write(
+            "INSERT OR IGNORE INTO docs(dir, doc_id) VALUES (?, ?)",
+            (self._run_dir_key, document_id)
+        )
+
+    def _scan_tree(self, root: str, index: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Walk a directory tree, returning index entries keyed by relative path."""
+        entries = {}
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            entry = self._scan_directory(path, index)
+            if not entry:
+                continue
+            entries[os.path.relpath(path, self.base_output_dir)] = entry
+            stack.extend(os.path.join(path, name) for name in entry['subdirs'])
+        return entries
+
+    def _scan_directory(self, path: str, index: Dict[str, Dict]) -> Optional[Dict]:
+        """
+        List one directory's PDFs and subfolders, reusing the index if unchanged.
+
+        Args:
+            path: Directory to scan
+            index: Previously saved entries keyed by path relative to base output dir
+
+        Returns:
+            Entry with mtime_ns, document ids and subdirectory names, or None if unreadable
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        cached = index.get(os.path.relpath(path, self.base_output_dir))
+        if cached and cached.get('mtime_ns') == mtime_ns:
+            return cached
+
+        ids = []
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name.endswith('.pdf'):
+                        # Extract document_id from filename: {docket}_{document_id}_{date}.pdf
+                        # (partition avoids building a list for every file)
+                        _, sep, rest = entry.name[:-4].partition('_')
+                        if sep:
+                            # Document ID is the second part (UUID format)
+                            ids.append(rest.partition('_')[0])
+        except OSError:
+            return None
+
+        return {'mtime_ns': mtime_ns, 'ids': ids, 'subdirs': subdirs}
+
+    def _writer_loop(self):
+        """Write queued (pdf path, filename, metadata) records until a None sentinel arrives."""
+        while True:
+            # Block for one item, then drain whatever else is already waiting so
+            # a burst of finished downloads is handled in a single wake-up
+            batch = [self._writer_queue.get()]
+            while len(batch) < self.WRITER_BATCH_SIZE:
+                try:
+                    batch.append(self._writer_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for item in batch:
+                try:
+                    if item is None:
+                        stop = True
+                        continue
+                    pdf_path, filename, metadata = item
+                    if self._metadata_jsonl_path is not None:
+                        if self._metadata_jsonl is None:
+                            self._metadata_jsonl = open(self._metadata_jsonl_path,
+                                                        'ab', buffering=1 << 20)
+                        record = dict(metadata, file=filename)
+                        self._metadata_jsonl.write(_json_dumps(record) + b'\n')
+                    else:
+                        with open(pdf_path[:-4] + '.json', 'wb') as f:
+                            f.write(_json_dumps(metadata, indent=True))
+                except Exception as e:
+                    logger.error(f"Error writing metadata: {e}")
+                    self._increment_stat('errors')
+                finally:
+                    self._writer_queue.task_done()
+            if self._metadata_jsonl is not None:
+                self._metadata_jsonl.flush()
+            if stop:
+                return
+
+    def close(self):
+        """Flush pending metadata writes, stop the writer thread and close the cache."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer_thread.is_alive():
+            self._writer_queue.put(None)
+            self._writer_thread.join()
+        if self._metadata_jsonl is not None:
+            self._metadata_jsonl.close()
+        with self._cache_lock:
+            self._commit_cache_locked()
+            # Every PDF in the run folder is now indexed, so record its current
+            # mtime and the next startup can skip listing it
+            try:
+                subdirs = [e.name for e in os.scandir(self.output_dir) if e.is_dir(follow_symlinks=False)]
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO dirs(path, mtime_ns, subdirs) VALUES (?, ?, ?)",
+                    (self._run_dir_key, os.stat(self.output_dir).st_mtime_ns,
+                     _json_dumps(subdirs).decode('utf-8'))
+                )
+                self._cache.commit()
+            except OSError:
+                pass
+            self._cache.close()
+
+    def _cached_download_url(self, document_id: str) -> Optional[str]:
+        """Return a cached signed URL that is valid for at least another minute."""
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT url FROM urls WHERE doc_id = ? AND expires > ?",
+                (document_id, int(time.time()) + 60)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _store_download_url(self, document_id: str, url: str):
+        """Cache a signed URL until its X-Amz-Expires lifetime (or a default TTL) runs out."""
+        ttl = self.DEFAULT_URL_TTL
+        expires_param = parse_qs(urlparse(url).query).get('X-Amz-Expires')
+        if expires_param:
+            try:
+                ttl = int(expires_param[0])
+            except ValueError:
+                pass
+        self._cache_write(
+            "INSERT OR REPLACE INTO urls(doc_id, url, expires) VALUES (?, ?, ?)",
+            (document_id, url, int(time.time()) + ttl)
+        )
+
+    def _forget_download_url(self, document_id: str):
+        """Drop a cached URL whose signature was rejected."""
+        self._cache_write("DELETE FROM urls WHERE doc_id = ?", (document_id,))
+
+    @staticmethod
+    def _url_hash(url: str) -> bytes:
+        """
+        Hash a download URL with its signing and expiry parameters removed.
+
+        Args:
+            url: Signed download URL
+
+        Returns:
+            SHA-1 digest identifying the underlying file
+        """
+        parsed = urlparse(url)
+        query = [
+            (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if not key.lower().startswith('x-amz-')
+            and key.lower() not in ('signature', 'expires', 'key-pair-id', 'policy')
+        ]
+        canonical = parsed._replace(query=urlencode(sorted(query)), fragment='').geturl()
+        return hashlib.sha1(canonical.encode('utf-8')).digest()
+
+    def _remember_url_hash(self, url_hash: bytes, document_id: str, filepath: str):
+        """Record which file the document behind a canonical download URL was saved as."""
+        self._url_memo[url_hash] = filepath
+        self._cache_write(
+            "INSERT OR REPLACE INTO url_hashes(hash, doc_id, path) VALUES (?, ?, ?)",
+            (url_hash, document_id, os.path.relpath(filepath, self.base_output_dir))
+        )
+
+    def _url_already_downloaded(self, url_hash: bytes) -> bool:
+        """Check whether the file saved for this URL hash is still on disk."""
+        path = self._url_memo.get(url_hash)
+        if path is None:
+            return False
+        try:
+            if os.stat(path).st_size > 0:
+                return True
+        except OSError:
+            pass
+        # The file was deleted since: forget it so the document is fetched again
+        self._url_memo.pop(url_hash, None)
+        self._cache_write("DELETE FROM url_hashes WHERE hash = ?", (url_hash,))
+        return False
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to this URL's host."""
+        host = urlparse(url).hostname or ''
+        with self._lock:
+            semaphore = self._host_slots.get(host)
+            if semaphore is None:
+                limit = max(1, self.config.get('max_connections_per_host', 16))
+                semaphore = self._host_slots[host] = threading.BoundedSemaphore(limit)
+        return semaphore
+
+    def _limiter_for(self, url: str) -> TokenBucket:
+        """Get the rate limiter for this URL's host (the shared API limiter for API hosts)."""
+        host = urlparse(url).hostname or ''
+        if host in self._api_hosts:
+            return self._limiter
+        with self._lock:
+            limiter = self._host_limiters.get(host)
+            if limiter is None:
+                limiter = self._host_limiters[host] = TokenBucket(
+                    self.config.get('download_rate_limit_rps', 0),
+                    self.config.get('rate_limit_burst', 5)
+                )
+        return limiter
+
+    def _requests_per_second(self) -> float:
+        """Resolve the request rate from rate_limit_rps or requests_per_minute, else rate_limit_delay."""
+        rps = self.config.get('rate_limit_rps')
+        if rps is not None:
+            return float(rps)
+        rpm = self.config.get('requests_per_minute')
+        if rpm is not None:
+            return float(rpm) / 60.0
+        delay = self.config.get('rate_limit_delay', 1.0)
+        return 1.0 / delay if delay > 0 else 0.0
+
+    def _observe_rate_limit_headers(self, response: requests.Response):
+        """Back off when the server signals we are being throttled."""
+        headers = response.headers
+        pause = None
+        try:
+            if 'Retry-After' in headers:
+                pause = float(headers['Retry-After'])
+            elif headers.get('X-RateLimit-Remaining') == '0':
+                reset = float(headers.get('X-RateLimit-Reset', 1.0))
+                # Some servers send an epoch timestamp rather than a delta
+                pause = reset - time.time() if reset > 1e9 else reset
+        except ValueError:
+            # HTTP-date or epoch formats: fall back to a short pause
+            pause = 1.0
+        if pause and pause > 0:
+            # Cap the pause so a bogus header can't stall the run
+            self._limiter.pause(min(pause, 60.0))
+
+        if response.status_code == 429:
+            self._limiter.backoff()
+        elif response.ok:
+            self._limiter.recover()
+
+    def _increment_stat(self, name: str):
+        """Increment a statistics counter (next() on itertools.count is atomic)."""
+        next(self._stat_counters[name])
+
+    def _stats_snapshot(self) -> Dict[str, int]:
+        """
+        Read the current statistics.
+
+        itertools.count can only be read by advancing it, so every read is
+        remembered and subtracted from later ones.
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        Returns:
+            Dictionary of counter name to value
+        """
+        snapshot = {}
+        with self._lock:
+            for name, counter in self._stat_counters.items():
+                snapshot[name] = next(counter) - self._stat_reads[name]
+                self._stat_reads[name] += 1
+        return snapshot
+
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None,
+                      parse: Optional[Callable[[BinaryIO], Any]] = None) -> Optional[Any]:
         """
         Make an API request with error handling.
 
         Args:
             endpoint: API endpoint path
             params: Query parameters
+            parse: Optional callable that parses the streamed response body
+                   itself (raising ValueError on bad JSON) instead of loading
+                   it whole
 
         Returns:
-            JSON response or None if error
+            JSON response (or the result of parse) or None if error
         """
-        url = f"{self.base_url}{endpoint}"
-        self.stats['api_calls'] += 1
+        url = f"{next(self._base_url_cycle)}{endpoint}"
+        self._increment_stat('api_calls')
 
         try:
-            self._rate_limit()
-            response = self.session.get(url, params=params, timeout=30)
+            self._limiter.acquire()
+            if parse is not None:
+                with self._host_semaphore(url), \
+                        self.session.get(url, params=params, timeout=30, stream=True) as response:
+                    self._observe_rate_limit_headers(response)
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    return parse(response.raw)
+            with self._host_semaphore(url):
+                response = self.session.get(url, params=params, timeout=30)
+            self._observe_rate_limit_headers(response)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.HTTPError as e:
             # Try to get more detailed error message from response
             error_detail = ""
@@ -118,54 +813,128 @@ class DAWSONExtractor:
                 error_detail = f": {e.response.text}"
             except:
                 pass
-            print(f"HTTP Error for {endpoint}: {e}{error_detail}")
-            self.stats['errors'] += 1
+            logger.error(f"HTTP Error for {endpoint}: {e}{error_detail}")
+            self._increment_stat('errors')
             return None
         except requests.exceptions.RequestException as e:
-            print(f"Error making request to {endpoint}: {e}")
-            self.stats['errors'] += 1
+            logger.error(f"Error making request to {endpoint}: {e}")
+            self._increment_stat('errors')
+            return None
+        except StreamError as e:
+            # A streamed body (see parse) is read from urllib3 directly, so a
+            # dropped connection or timeout mid-body surfaces as a urllib3 error
+            logger.error(f"Error reading response from {endpoint}: {e}")
+            self._increment_stat('errors')
+            return None
+        except ValueError as e:
+            logger.error(f"Invalid JSON from {endpoint}: {e}")
+            self._increment_stat('errors')
             return None
 
-    def search_orders(self, keyword: str = "order") -> List[str]:
+    def _order_search(self, keyword: str) -> Optional[List[Dict]]:
         """
-        Search for court documents and return unique docket numbers.
+        Run one order-search query.
 
         Args:
             keyword: Search keyword for documents
 
         Returns:
-            List of unique docket numbers
+            List of search result items, or None if the request failed
         """
-        print(f"Searching for documents with keyword: '{keyword}'...")
+        if self._search_ttl > 0:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    "SELECT body FROM searches WHERE keyword = ? AND fetched_at > ?",
+                    (keyword, int(time.time() - self._search_ttl))
+                ).fetchone()
+            if row:
+                return _json_loads(row[0])
 
         params = {
             "keyword": keyword,
             "dateRange": "allDates",
             "limit": 5000
         }
-        data = self._make_request("/public-api/order-search", params=params)
 
-        if not data:
-            print("Failed to retrieve search results")
-            return []
+        if ijson is not None:
+            # Stream the items so the full response tree is never built
+            results = self._make_request("/public-api/order-search", params=params,
+                                         parse=self._parse_search_stream)
+            if results is None:
+                return None
+        else:
+            data = self._make_request("/public-api/order-search", params=params)
+            if not data:
+                return None
+            # Only the fields callers read are kept, which keeps the cache small
+            results = [
+                {'docketNumber': item.get('docketNumber'),
+                 'documentType': item.get('documentType')}
+                for item in data.get('results', [])
+            ]
+
+        if self._search_ttl > 0:
+            self._cache_write(
+                "INSERT OR REPLACE INTO searches(keyword, fetched_at, body) VALUES (?, ?, ?)",
+                (keyword, int(time.time()), _json_dumps(results))
+            )
+        return results
+
+    @staticmethod
+    def _parse_search_stream(stream: BinaryIO) -> List[Dict]:
+        """
+        Pull docket numbers and document types out of a streamed search response.
 
-        # Extract unique docket numbers from results
-        docket_numbers = set()
-        results = data.get('results', [])
+        Args:
+            stream: Raw order-search response body
+
+        Returns:
+            List of {'docketNumber', 'documentType'} items
+        """
+        results = []
+        try:
+            for item in ijson.items(stream, 'results.item'):
+                results.append({'docketNumber': item.get('docketNumber'),
+                                'documentType': item.get('documentType')})
+        except ijson.JSONError as e:
+            raise ValueError(e)
+        return results
+
+    def search_orders(self, keyword: str = "order",
+                      seen: Optional[Set[str]] = None) -> Set[str]:
+        """
+        Search for court documents and return unique docket numbers.
+
+        Args:
+            keyword: Search keyword for documents
+            seen: Optional set shared across keywords; docket numbers are added
+                  to it in place, so duplicates are dropped on insertion
+
+        Returns:
+            The set of unique docket numbers (seen, if given)
+        """
+        logger.info(f"Searching for documents with keyword: '{keyword}'...")
+
+        docket_numbers = seen if seen is not None else set()
+        results = self._order_search(keyword)
+
+        if results is None:
+            logger.error("Failed to retrieve search results")
+            return docket_numbers
 
-        # Get allowed document types from config
-        allowed_types = self.config.get('document_types', ['Order'])
+        # Extract unique docket numbers from results
+        known = len(docket_numbers)
 
         for item in results:
             docket_number = item.get('docketNumber')
             document_type = item.get('documentType', '')
 
             # Check if document type matches
-            if docket_number and self._matches_document_type(document_type, allowed_types):
+            if docket_number and self._matches_document_type(document_type):
                 docket_numbers.add(docket_number)
 
-        print(f"Found {len(docket_numbers)} unique dockets with matching documents")
-        return list(docket_numbers)
+        logger.info(f"Found {len(docket_numbers) - known} new unique dockets with matching documents")
+        return docket_numbers
 
     def get_case_details(self, docket_number: str) -> Optional[Dict]:
         """
@@ -177,32 +946,73 @@ class DAWSONExtractor:
         Returns:
             Case details or None if error
         """
-        return self._make_request(f"/public-api/cases/{docket_number}")
+        if self._case_ttl > 0:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    "SELECT body FROM cases WHERE docket = ? AND fetched_at > ?",
+                    (docket_number, int(time.time() - self._case_ttl))
+                ).fetchone()
+            if row:
+                return _json_loads(row[0])
+
+        case_data = self._make_request(f"/public-api/cases/{docket_number}")
+        if case_data is not None and self._case_ttl > 0:
+            self._cache_write(
+                "INSERT OR REPLACE INTO cases(docket, fetched_at, body) VALUES (?, ?, ?)",
+                (docket_number, int(time.time()), _json_dumps(case_data))
+            )
+        return case_data
+
+    @staticmethod
+    def _build_automaton(patterns: List[str]):
+        """
+        Build an Aho-Corasick automaton for substring matching, if available.
+
+        Args:
+            patterns: Lowercased document type patterns
+
+        Returns:
+            Automaton, or None if pyahocorasick isn't installed or patterns are unsuitable
+        """
+        if ahocorasick is None or not patterns or not all(patterns):
+            return None
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return automaton
 
-    def _matches_document_type(self, document_type: str, allowed_types: List[str]) -> bool:
+    def _matches_document_type(self, document_type: str) -> bool:
         """
-        Check if a document type matches the allowed types.
+        Check if a document type matches the configured document types.
 
         Args:
             document_type: The document type to check
-            allowed_types: List of allowed type patterns
 
         Returns:
             True if document_type matches any allowed type
         """
-        match_mode = self.config.get('match_mode', 'substring')
-
-        if match_mode == 'exact':
-            return any(
-                doc_type.lower() == document_type.lower()
-                for doc_type in allowed_types
-            )
+        # Search results draw from a few dozen distinct types, so remember answers
+        cached = self._type_match_cache.get(document_type)
+        if cached is not None:
+            return cached
+
+        lowered = document_type.lower()
+
+        if self._match_mode == 'exact':
+            matches = lowered in self._allowed_lower_set
+        elif self._automaton is not None:
+            # One pass over document_type regardless of how many patterns
+            matches = next(self._automaton.iter(lowered), None) is not None
         else:  # substring (default)
-            return any(
-                doc_type.lower() in document_type.lower()
-                for doc_type in allowed_types
+            matches = any(
+                doc_type in lowered
+                for doc_type in self._allowed_lower_list
             )
 
+        self._type_match_cache[document_type] = matches
+        return matches
+
     def filter_court_orders(self, case_data: Dict) -> List[Dict]:
         """
         Filter docket entries for configured document types.
@@ -214,25 +1024,31 @@ class DAWSONExtractor:
             List of matching document entries
         """
         documents = []
+        intern = sys.intern
 
-        # Get allowed document types from config
-        allowed_types = self.config.get('document_types', ['Order'])
+        # Every order from a case shares its docket number, and document types
+        # come from a small vocabulary, so intern both to share one string each
+        docket_number = case_data.get('docketNumber')
+        if docket_number:
+            docket_number = intern(docket_number)
 
         docket_entries = case_data.get('docketEntries', [])
         for entry in docket_entries:
-            document_type = entry.get('documentType', '')
-            is_sealed = entry.get('isSealed', False)
+            # Sealed and ID-less entries can never be downloaded, so skip
+            # them before doing any string work on the type
+            if entry.get('isSealed', False):
+                continue
             document_id = entry.get('docketEntryId')
-
-            # Check if document type matches
-            matches_type = self._matches_document_type(document_type, allowed_types)
+            if not document_id:
+                continue
 
             # Only include public documents that match configured types
-            if matches_type and not is_sealed and document_id:
+            document_type = entry.get('documentType', '')
+            if self._matches_document_type(document_type):
                 documents.append({
-                    'docket_number': case_data.get('docketNumber'),
-                    'docket_entry_id': document_id,
-                    'document_type': document_type,
+                    'docket_number': docket_number,
+                    'docket_entry_id': intern(document_id),
+                    'document_type': intern(document_type),
                     'description': entry.get('description', ''),
                     'filed_date': entry.get('filingDate', 'Unknown')
                 })
@@ -253,52 +1069,84 @@ class DAWSONExtractor:
             'downloaded' if successful, 'skipped' if already exists, 'error' if failed
         """
         # Check if document already exists
-        if document_id in self.existing_docs:
-            self.stats['orders_skipped'] += 1
+        if self._already_downloaded(document_id):
+            self._increment_stat('orders_skipped')
             return 'skipped'
 
-        # Get download URL
-        endpoint = f"/public-api/{docket_number}/{document_id}/public-document-download-url"
-        response = self._make_request(endpoint)
-
-        if not response or 'url' not in response:
-            print(f"Failed to get download URL for {docket_number}/{document_id}")
-            return 'error'
-
-        download_url = response['url']
+        # Create filename (filing dates are ISO-8601, so the date is the first 10 chars)
+        filename = (f"{docket_number.translate(_DOCKET_TABLE)}_{document_id}_"
+                    f"{metadata.get('filed_date', 'Unknown')[:10]}.pdf")
+        filepath = f"{self._output_dir_str}{os.sep}{filename}"
 
-        # Create filename
-        safe_docket = docket_number.replace('/', '_')
-        filed_date = metadata.get('filed_date', 'Unknown').split('T')[0]
-        filename = f"{safe_docket}_{document_id}_{filed_date}.pdf"
-        filepath = self.output_dir / filename
+        # Already on disk from earlier in this run: skip the download-URL call
+        try:
+            if os.stat(filepath).st_size > 0:
+                self.existing_docs.add(sys.intern(document_id))
+                self._increment_stat('orders_skipped')
+                return 'skipped'
+        except OSError:
+            pass
+
+        # Get download URL (reusing one signed on a previous attempt if still valid)
+        download_url = self._cached_download_url(document_id)
+        if download_url is None:
+            endpoint = f"/public-api/{docket_number}/{document_id}/public-document-download-url"
+            response = self._make_request(endpoint)
+
+            if not response or 'url' not in response:
+                logger.error(f"Failed to get download URL for {docket_number}/{document_id}")
+                return 'error'
+
+            download_url = response['url']
+            self._store_download_url(document_id, download_url)
+
+        # Another docket entry already resolved to this same file
+        url_hash = self._url_hash(download_url)
+        if self._url_already_downloaded(url_hash):
+            self.existing_docs.add(sys.intern(document_id))
+            self._increment_stat('orders_skipped')
+            return 'skipped'
 
         # Download the PDF
+        part_path = filepath + '.part'
         try:
-            self._rate_limit()
-            pdf_response = self.session.get(download_url, timeout=60)
-            pdf_response.raise_for_status()
+            self._limiter_for(download_url).acquire()
+            with self._host_semaphore(download_url), \
+                    self.session.get(download_url, timeout=60, stream=True) as pdf_response:
+                pdf_response.raise_for_status()
 
-            # Save to file
-            with open(filepath, 'wb') as f:
-                f.write(pdf_response.content)
+                # Stream to a .part file so memory stays bounded regardless of PDF
+                # size, and an interrupted transfer never looks like a finished PDF
+                pdf_response.raw.decode_content = True
+                with open(part_path, 'wb') as f:
+                    shutil.copyfileobj(pdf_response.raw, f, length=1024 * 1024)
+            os.replace(part_path, filepath)
 
-            print(f"Downloaded: {filename}")
-            self.stats['orders_downloaded'] += 1
+            logger.info(f"Downloaded: {filename}")
+            self._increment_stat('orders_downloaded')
 
             # Add to existing docs set to prevent re-downloading in same session
-            self.existing_docs.add(document_id)
+            self.existing_docs.add(sys.intern(document_id))
+            self._index_downloaded_document(document_id)
+            self._remember_url_hash(url_hash, document_id, filepath)
 
-            # Save metadata
-            metadata_file = filepath.with_suffix('.json')
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            # Save metadata (written in the background)
+            self._writer_queue.put((filepath, filename, metadata))
 
             return 'downloaded'
 
         except Exception as e:
-            print(f"Error downloading document: {e}")
-            self.stats['errors'] += 1
+            logger.error(f"Error downloading document: {e}")
+            self._increment_stat('errors')
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
+            # Keep the signed URL for a retry after connection errors and 5xx,
+            # but fetch a fresh one next time if the signature was rejected
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            if status in (400, 401, 403):
+                self._forget_download_url(document_id)
             return 'error'
 
     def extract_orders(self, num_orders: int):
@@ -313,57 +1161,60 @@ class DAWSONExtractor:
         min_per_type = self.config.get('min_per_type', 0)
         document_types = self.config.get('document_types', ['Order'])
 
-        # Track counts per document type
+        # Track counts per document type, looked up case-insensitively
+        # (the first spelling wins if a type is configured twice)
         type_counts = {doc_type: 0 for doc_type in document_types}
+        configured_types = {doc_type.lower(): doc_type for doc_type in reversed(document_types)}
 
-        print(f"\n=== DAWSON Document Extractor ===")
-        print(f"Target: {num_orders} total documents")
-        print(f"Document types: {', '.join(document_types)}")
+        logger.info(f"\n=== DAWSON Document Extractor ===")
+        logger.info(f"Target: {num_orders} total documents")
+        logger.info(f"Document types: {', '.join(document_types)}")
         if min_per_type > 0:
-            print(f"Minimum per type: {min_per_type}")
-        print(f"Existing: {existing_count} documents")
-        print(f"To download: {needed} new documents")
-        print(f"Output: {self.output_dir}")
-        print(f"Rate limit: {self.config.get('rate_limit_delay', 1.0)}s between requests\n")
+            logger.info(f"Minimum per type: {min_per_type}")
+        logger.info(f"Existing: {existing_count} documents")
+        logger.info(f"To download: {needed} new documents")
+        logger.info(f"Output: {self.output_dir}")
+        logger.info(f"Rate limit: {self._limiter.rate:g} requests/s (burst {self._limiter.capacity:g})")
+        logger.info(f"Workers: {self.config.get('max_workers', 8)} dockets, "
+                    f"{self.config.get('download_workers', 5)} downloads\n")
 
         if needed == 0:
-            print("Already have enough documents. Nothing to download.")
+            logger.info("Already have enough documents. Nothing to download.")
             self._print_summary()
             return
 
         # Step 1: Search for orders
         search_keywords = self.config.get('search_keywords', ['order'])
-        all_dockets = []
+        all_dockets: Set[str] = set()
 
         for keyword in search_keywords:
-            dockets = self.search_orders(keyword)
-            all_dockets.extend(dockets)
-
-        # Get unique dockets
-        unique_dockets = list(set(all_dockets))
+            self.search_orders(keyword, all_dockets)
 
-        if not unique_dockets:
-            print("No dockets found. Exiting.")
+        if not all_dockets:
+            logger.warning("No dockets found. Exiting.")
             return
 
-        # Step 2: Randomly shuffle to get random dockets
-        random.shuffle(unique_dockets)
+        logger.info(f"\nProcessing {len(all_dockets)} unique dockets...")
 
-        print(f"\nProcessing {len(unique_dockets)} unique dockets...")
-
-        # Step 3: Process dockets until we have enough orders
+        # Track shared progress across the pipeline stages
+        max_workers = max(1, self.config.get('max_workers', 8))
+        download_workers = max(1, self.config.get('download_workers', 5))
+        total_dockets = len(all_dockets)
+        progress_lock = threading.Lock()
+        progress = threading.Condition(progress_lock)
+        stop = threading.Event()
         orders_collected = 0
-        docket_index = 0
+        in_flight = 0
+        queued = 0
 
-        def needs_type(doc_type: str) -> bool:
-            """Check if we still need more of this document type."""
+        def needs_type(doc_type_lower: str) -> bool:
+            """Check if we still need more of this (lowercased) document type."""
             if min_per_type <= 0:
                 return True
-            # Find matching configured type (case-insensitive)
-            for configured_type in document_types:
-                if configured_type.lower() == doc_type.lower():
-                    return type_counts.get(configured_type, 0) < min_per_type
-            return True
+            configured_type = configured_types.get(doc_type_lower)
+            if configured_type is None:
+                return True
+            return type_counts[configured_type] < min_per_type
 
         def all_minimums_met() -> bool:
             """Check if all document types have met their minimums."""
@@ -371,81 +1222,236 @@ class DAWSONExtractor:
                 return True
             return all(count >= min_per_type for count in type_counts.values())
 
-        while orders_collected < needed and docket_index < len(unique_dockets):
-            docket = unique_dockets[docket_index]
-            docket_index += 1
+        def finished() -> bool:
+            """Check if enough documents have been collected (or we were interrupted)."""
+            with progress_lock:
+                return stop.is_set() or orders_collected >= needed
+
+        def wait_for_demand():
+            """Block fetchers while queued and in-flight downloads already cover the target."""
+            with progress:
+                while (not stop.is_set() and orders_collected < needed
+                       and orders_collected + in_flight + queued >= needed):
+                    progress.wait(0.5)
+
+        def claim(doc_type_lower: str) -> bool:
+            """Take a queued order and reserve a download slot, never overshooting the target."""
+            nonlocal in_flight, queued
+            with progress:
+                queued -= 1
+                if stop.is_set() or orders_collected + in_flight >= needed:
+                    progress.notify_all()
+                    return False
+                # Skip if we don't need this type anymore (when filling minimums)
+                if not all_minimums_met() and not needs_type(doc_type_lower):
+                    progress.notify_all()
+                    return False
+                in_flight += 1
+                return True
 
-            print(f"\n[{docket_index}/{len(unique_dockets)}] Processing docket: {docket}")
+        def settle(doc_type_lower: str, result: str):
+            """Release a download slot and record the outcome."""
+            nonlocal orders_collected, in_flight
+            with progress:
+                in_flight -= 1
+                progress.notify_all()
+                if result != 'downloaded':
+                    return
+                orders_collected += 1
+                # Track type counts
+                configured_type = configured_types.get(doc_type_lower)
+                if configured_type is not None:
+                    type_counts[configured_type] += 1
+                logger.info(f"  Progress: {orders_collected}/{needed} new downloads")
+
+        def download_one(order: Dict) -> str:
+            """Download a single queued document if a slot is still available."""
+            doc_type_lower = order['document_type'].lower()
+            if not claim(doc_type_lower):
+                return 'skipped'
+
+            result = 'error'
+            try:
+                result = self.download_document(
+                    order['docket_number'],
+                    order['docket_entry_id'],
+                    order
+                )
+            finally:
+                settle(doc_type_lower, result)
+            return result
+
+        def enqueue(order: Dict) -> bool:
+            """Hand an order to the downloaders, waiting while the queue is full."""
+            nonlocal queued
+            with progress:
+                queued += 1
+            while not finished():
+                try:
+                    pending_orders.put(order, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            with progress:
+                queued -= 1
+            return False
+
+        def download_worker():
+            """Consume queued orders until a None sentinel arrives."""
+            while True:
+                order = pending_orders.get()
+                if order is None:
+                    return
+                # If every downloader died the order queue would fill and the
+                # case workers would block in enqueue() forever
+                try:
+                    download_one(order)
+                except Exception as e:
+                    logger.error(f"Error downloading document "
+                                 f"{order.get('docket_entry_id')}: {e}")
+                    self._increment_stat('errors')
+
+        def process_docket(position: int, docket: str):
+            """Fetch one docket and queue its matching documents for download."""
+            # Don't fetch further ahead than the downloads still need
+            wait_for_demand()
+            if finished():
+                return
+
+            logger.info(f"\n[{position}/{total_dockets}] Processing docket: {docket}")
 
             # Get case details
             case_data = self.get_case_details(docket)
             if not case_data:
-                continue
+                return
 
             # Filter for configured document types
             documents = self.filter_court_orders(case_data)
 
             if not documents:
-                print(f"  No matching documents found in docket {docket}")
-                continue
+                logger.info(f"  No matching documents found in docket {docket}")
+                return
 
             # If minimums not met, prioritize under-represented types
-            if not all_minimums_met():
-                documents = [doc for doc in documents if needs_type(doc['document_type'])]
-                if not documents:
-                    continue
+            with progress_lock:
+                if not all_minimums_met():
+                    documents = [doc for doc in documents if needs_type(doc['document_type'].lower())]
+            if not documents:
+                return
 
-            print(f"  Found {len(documents)} matching document(s)")
+            logger.info(f"  Found {len(documents)} matching document(s)")
 
-            # Download documents from this docket
+            # Hand off to the downloaders and move straight on to the next docket
             for order in documents:
-                if orders_collected >= needed:
+                if not enqueue(order):
                     break
 
-                # Skip if we don't need this type anymore (when filling minimums)
-                if not all_minimums_met() and not needs_type(order['document_type']):
-                    continue
-
-                result = self.download_document(
-                    order['docket_number'],
-                    order['docket_entry_id'],
-                    order
-                )
-
-                if result == 'downloaded':
-                    orders_collected += 1
-                    # Track type counts
-                    for configured_type in document_types:
-                        if configured_type.lower() == order['document_type'].lower():
-                            type_counts[configured_type] = type_counts.get(configured_type, 0) + 1
+        def case_worker():
+            """Consume queued dockets until a None sentinel arrives."""
+            while True:
+                item = pending_dockets.get()
+                if item is None:
+                    return
+                # A worker that died here would leave the producer and
+                # enqueue() waiting forever, so count the failure and carry on
+                try:
+                    process_docket(*item)
+                except Exception as e:
+                    logger.error(f"Error processing docket {item[1]}: {e}")
+                    self._increment_stat('errors')
+
+        def produce_dockets():
+            """Feed random dockets to the case workers until the target is met."""
+            # Pick dockets in rounds with a partial Fisher-Yates shuffle: each
+            # pick is swapped to the tail of the undrawn region, so a round
+            # costs O(budget) rather than shuffling the whole list when
+            # num_orders is much smaller than the number of dockets found.
+            pool = list(all_dockets)
+            remaining = len(pool)
+            position = 0
+            while remaining and not finished():
+                budget = min(remaining, max(needed * 4, 50))
+                candidates = []
+                for _ in range(budget):
+                    pick = random.randrange(remaining)
+                    remaining -= 1
+                    pool[pick], pool[remaining] = pool[remaining], pool[pick]
+                    candidates.append(pool[remaining])
+
+                for docket in candidates:
+                    position += 1
+                    while not finished():
+                        try:
+                            pending_dockets.put((position, docket), timeout=0.5)
                             break
-                    print(f"  Progress: {orders_collected}/{needed} new downloads")
-                elif result == 'skipped':
-                    pass  # Already exists, silently skip
+                        except queue.Full:
+                            continue
+                    else:
+                        return
+
+        # Step 2: Process dockets in a three-stage pipeline. The producer
+        # samples dockets lazily into a bounded queue, case workers fetch
+        # details and push matching orders onto a second bounded queue, and
+        # downloaders drain that, so metadata and PDF fetches overlap
+        pending_dockets: queue.Queue = queue.Queue(maxsize=max_workers * 2)
+        pending_orders: queue.Queue = queue.Queue(maxsize=download_workers * 2)
+        case_workers = [
+            threading.Thread(target=case_worker, daemon=True)
+            for _ in range(max_workers)
+        ]
+        downloaders = [
+            threading.Thread(target=download_worker, daemon=True)
+            for _ in range(download_workers)
+        ]
+        for thread in case_workers + downloaders:
+            thread.start()
+
+        try:
+            try:
+                produce_dockets()
+                for _ in case_workers:
+                    pending_dockets.put(None)
+                for thread in case_workers:
+                    thread.join()
+            except KeyboardInterrupt:
+                # Let in-flight downloads finish, but start nothing new
+                stop.set()
+                with progress:
+                    progress.notify_all()
+                raise
+        finally:
+            for _ in downloaders:
+                pending_orders.put(None)
+            for thread in downloaders:
+                thread.join()
+
+        # Make sure every sidecar is on disk before reporting
+        self._writer_queue.join()
 
         # Print summary with type breakdown
         self._print_summary(type_counts)
 
     def _print_summary(self, type_counts: Optional[Dict[str, int]] = None):
         """Print extraction summary statistics."""
-        duration = (datetime.now() - self.stats['start_time']).total_seconds()
+        stats = self._stats_snapshot()
+        duration = (datetime.now() - self.start_time).total_seconds()
         total_docs = len(self.existing_docs)
 
-        print("\n" + "="*50)
-        print("EXTRACTION COMPLETE")
-        print("="*50)
-        print(f"New documents downloaded: {self.stats['orders_downloaded']}")
-        print(f"Documents skipped (already existed): {self.stats['orders_skipped']}")
-        print(f"Total documents in library: {total_docs}")
+        logger.info("\n" + "="*50)
+        logger.info("EXTRACTION COMPLETE")
+        logger.info("="*50)
+        logger.info(f"New documents downloaded: {stats['orders_downloaded']}")
+        logger.info(f"Documents skipped (already existed): {stats['orders_skipped']}")
+        logger.info(f"Total documents in library: {total_docs}")
         if type_counts:
-            print(f"\nDownloaded by type:")
+            logger.info(f"\nDownloaded by type:")
             for doc_type, count in type_counts.items():
-                print(f"  {count:4d}  {doc_type}")
-        print(f"Total API calls: {self.stats['api_calls']}")
-        print(f"Errors: {self.stats['errors']}")
-        print(f"Duration: {duration:.1f} seconds")
-        print(f"Output directory: {self.output_dir.absolute()}")
-        print("="*50)
+                logger.info(f"  {count:4d}  {doc_type}")
+        logger.info(f"Total API calls: {stats['api_calls']}")
+        logger.info(f"Errors: {stats['errors']}")
+        logger.info(f"Duration: {duration:.1f} seconds")
+        logger.info(f"Output directory: {self.output_dir.absolute()}")
+        logger.info("="*50)
 
     def discover_document_types(self) -> Dict[str, int]:
         """
@@ -454,7 +1460,7 @@ class DAWSONExtractor:
         Returns:
             Dict mapping document type names to occurrence counts
         """
-        print("\n=== DAWSON Document Type Discovery ===\n")
+        logger.info("\n=== DAWSON Document Type Discovery ===\n")
 
         # Keywords to search - covers major document categories
         discovery_keywords = [
@@ -463,48 +1469,42 @@ class DAWSONExtractor:
             "stipulation", "response", "reply", "objection", "report"
         ]
 
-        type_counts: Dict[str, int] = {}
-
-        for keyword in discovery_keywords:
-            print(f"Searching with keyword: '{keyword}'...")
-
-            params = {
-                "keyword": keyword,
-                "dateRange": "allDates",
-                "limit": 5000
-            }
-            data = self._make_request("/public-api/order-search", params=params)
+        type_counts: Counter = Counter()
 
-            if not data:
-                continue
+        def search(keyword: str) -> Optional[List[Dict]]:
+            logger.info(f"Searching with keyword: '{keyword}'...")
+            return self._order_search(keyword)
 
-            results = data.get('results', [])
-            for item in results:
-                doc_type = item.get('documentType', '')
-                if doc_type:
-                    type_counts[doc_type] = type_counts.get(doc_type, 0) + 1
+        # Searches are independent, so run them concurrently (still rate limited)
+        max_workers = max(1, self.config.get('max_workers', 8))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for results in executor.map(search, discovery_keywords):
+                if results:
+                    type_counts.update(
+                        doc_type for doc_type in (item.get('documentType') for item in results)
+                        if doc_type
+                    )
 
         # Save catalog
         catalog = {
             "discovered_at": datetime.now().isoformat(),
             "total_types": len(type_counts),
-            "types": dict(sorted(type_counts.items(), key=lambda x: -x[1]))
+            "types": dict(type_counts.most_common())
         }
 
         catalog_path = Path("document_types_catalog.json")
-        with open(catalog_path, 'w') as f:
-            json.dump(catalog, f, indent=2)
-
-        print(f"\n{'='*50}")
-        print(f"DISCOVERY COMPLETE")
-        print(f"{'='*50}")
-        print(f"Document types found: {len(type_counts)}")
-        print(f"Catalog saved to: {catalog_path.absolute()}")
-        print(f"Total API calls: {self.stats['api_calls']}")
-        print(f"\nTop 10 document types:")
+        catalog_path.write_bytes(_json_dumps(catalog, indent=True))
+
+        logger.info(f"\n{'='*50}")
+        logger.info(f"DISCOVERY COMPLETE")
+        logger.info(f"{'='*50}")
+        logger.info(f"Document types found: {len(type_counts)}")
+        logger.info(f"Catalog saved to: {catalog_path.absolute()}")
+        logger.info(f"Total API calls: {self._stats_snapshot()['api_calls']}")
+        logger.info(f"\nTop 10 document types:")
         for doc_type, count in list(catalog['types'].items())[:10]:
-            print(f"  {count:5d}  {doc_type}")
-        print(f"{'='*50}")
+            logger.info(f"  {count:5d}  {doc_type}")
+        logger.info(f"{'='*50}")
 
         return type_counts
 
@@ -513,25 +1513,24 @@ class DAWSONExtractor:
         catalog_path = Path("document_types_catalog.json")
 
         if not catalog_path.exists():
-            print("No document type catalog found.")
-            print("Run with --discover first to catalog document types from the API.")
+            logger.warning("No document type catalog found.")
+            logger.info("Run with --discover first to catalog document types from the API.")
             return
 
-        with open(catalog_path, 'r') as f:
-            catalog = json.load(f)
+        catalog = _json_loads(catalog_path.read_bytes())
 
-        print(f"\n=== DAWSON Document Types ===")
-        print(f"Discovered: {catalog.get('discovered_at', 'Unknown')}")
-        print(f"Total types: {catalog.get('total_types', 0)}")
-        print(f"\n{'Count':>6}  Type")
-        print("-" * 50)
+        logger.info(f"\n=== DAWSON Document Types ===")
+        logger.info(f"Discovered: {catalog.get('discovered_at', 'Unknown')}")
+        logger.info(f"Total types: {catalog.get('total_types', 0)}")
+        logger.info(f"\n{'Count':>6}  Type")
+        logger.info("-" * 50)
 
         for doc_type, count in catalog.get('types', {}).items():
-            print(f"{count:6d}  {doc_type}")
+            logger.info(f"{count:6d}  {doc_type}")
 
-        print("-" * 50)
-        print("\nTo use exact matching, add types to config.json document_types list")
-        print("and set match_mode to 'exact'.")
+        logger.info("-" * 50)
+        logger.info("\nTo use exact matching, add types to config.json document_types list")
+        logger.info("and set match_mode to 'exact'.")
 
 
 def load_config(config_file: str = 'config.json') -> Dict:
@@ -541,23 +1540,33 @@ def load_config(config_file: str = 'config.json') -> Dict:
         'num_orders': 10,
         'document_types': ['Order'],
         'match_mode': 'substring',
+        'metadata_format': 'json',
         'api_environment': 'green',
         'rate_limit_delay': 1.0,
+        'rate_limit_burst': 5,
+        'max_workers': 8,
+        'download_workers': 5,
+        'max_retries': 5,
+        'max_connections_per_host': 16,
+        'download_rate_limit_rps': 0,
+        'bloom_filter_threshold': 100_000,
+        'case_details_ttl_hours': 24,
+        'search_cache_ttl_hours': 24,
         'output_dir': 'downloads',
         'search_keywords': ['order']
     }
 
     if os.path.exists(config_file):
         try:
-            with open(config_file, 'r') as f:
-                user_config = json.load(f)
+            with open(config_file, 'rb') as f:
+                user_config = _json_loads(f.read())
                 default_config.update(user_config)
-                print(f"Loaded configuration from {config_file}")
+                logger.info(f"Loaded configuration from {config_file}")
         except Exception as e:
-            print(f"Error loading config file: {e}")
-            print("Using default configuration")
+            logger.error(f"Error loading config file: {e}")
+            logger.warning("Using default configuration")
     else:
-        print(f"Config file not found. Using defaults.")
+        logger.info(f"Config file not found. Using defaults.")
 
     return default_config
 
@@ -575,6 +1584,7 @@ Examples:
   %(prog)s 25               Download 25 documents
   %(prog)s --discover       Discover and catalog all document types from API
   %(prog)s --list-types     List all discovered document types
+  %(prog)s --fresh          Ignore cached search results and case details
         '''
     )
     parser.add_argument('num_orders', nargs='?', type=int,
@@ -583,26 +1593,41 @@ Examples:
                         help='Discover document types from API and save to catalog')
     parser.add_argument('--list-types', action='store_true',
                         help='List all discovered document types')
+    parser.add_argument('--fresh', action='store_true',
+                        help='Ignore cached search results and case details for this run')
 
     args = parser.parse_args()
 
-    # Load configuration
-    config = load_config()
+    listener = setup_logging()
+    try:
+        # Load configuration
+        config = load_config()
 
-    # Override num_orders if provided
-    if args.num_orders is not None:
-        config['num_orders'] = args.num_orders
+        # Override num_orders if provided
+        if args.num_orders is not None:
+            config['num_orders'] = args.num_orders
 
-    # Create extractor
-    extractor = DAWSONExtractor(config)
+        # A zero TTL disables the search and case-details caches
+        if args.fresh:
+            config['search_cache_ttl_hours'] = 0
+            config['case_details_ttl_hours'] = 0
 
-    # Handle different modes
-    if args.discover:
-        extractor.discover_document_types()
-    elif args.list_types:
-        extractor.list_document_types()
-    else:
-        extractor.extract_orders(config['num_orders'])
+        # Create extractor
+        extractor = DAWSONExtractor(config)
+
+        # Handle different modes
+        try:
+            if args.discover:
+                extractor.discover_document_types()
+            elif args.list_types:
+                extractor.list_document_types()
+            else:
+                extractor.extract_orders(config['num_orders'])
+        finally:
+            extractor.close()
+    finally:
+        # Flush any queued log records before exiting
+        listener.stop()
 
 
 if __name__ == '__main__':